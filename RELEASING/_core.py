@@ -0,0 +1,281 @@
+#
+# Licensed to the Apache Software Foundation (ASF) under one or more
+# contributor license agreements.  See the NOTICE file distributed with
+# this work for additional information regarding copyright ownership.
+# The ASF licenses this file to You under the Apache License, Version 2.0
+# (the "License"); you may not use this file except in compliance with
+# the License.  You may obtain a copy of the License at
+#
+#    http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+#
+import os
+import sys
+from dataclasses import dataclass, field
+from functools import lru_cache
+from types import MappingProxyType
+from typing import Any, List, Mapping, Optional, Type, TYPE_CHECKING
+
+import click
+
+if TYPE_CHECKING:
+    import smtplib
+    import ssl
+    from types import TracebackType
+
+    import jinja2
+
+
+SMTP_PORT = 587
+SMTP_SERVER = "mail-relay.apache.org"
+PROJECT_NAME = "Superset"
+PROJECT_MODULE = "superset"
+PROJECT_DESCRIPTION = "Apache Superset is a modern, enterprise-ready business intelligence web application"
+RELEASING_FOLDER = os.path.dirname(os.path.abspath(__file__))
+EMAIL_TEMPLATES_FOLDER = os.path.join(RELEASING_FOLDER, "email_templates")
+EMAIL_TEMPLATES_COMPILED_FOLDER = os.path.join(
+    RELEASING_FOLDER, "email_templates_compiled"
+)
+
+
+def string_comma_to_list(message: str) -> List[str]:
+    if not message:
+        return []
+    elements = (element.strip() for element in message.split(","))
+    return [element for element in elements if element]
+
+
+@lru_cache(maxsize=1)
+def get_ssl_context() -> "ssl.SSLContext":
+    """
+    Create the default SSL context once, it loads the system trust store
+
+    :return: The SSL context used for STARTTLS
+    """
+    import ssl
+
+    return ssl.create_default_context()
+
+
+class SMTPSession:
+    """
+    An authenticated SMTP connection that can send multiple emails, use it as a
+    context manager so the TCP, TLS and login handshakes happen only once
+    """
+
+    def __init__(
+        self, smtp_server: str, smtp_port: int, username: str, password: str
+    ) -> None:
+        self.smtp_server = smtp_server
+        self.smtp_port = smtp_port
+        self.username = username
+        self.password = password
+        self.server: Optional["smtplib.SMTP"] = None
+        self.has_sent = False
+
+    def __enter__(self) -> "SMTPSession":
+        import smtplib
+
+        server = smtplib.SMTP(self.smtp_server, self.smtp_port)
+        try:
+            server.starttls(context=get_ssl_context())
+            server.login(self.username, self.password)
+        except Exception:
+            server.close()
+            raise
+        self.server = server
+        self.has_sent = False
+        return self
+
+    def __exit__(
+        self,
+        exc_type: Optional[Type[BaseException]],
+        exc_value: Optional[BaseException],
+        traceback: Optional["TracebackType"],
+    ) -> None:
+        if self.server is not None:
+            self.server.__exit__(exc_type, exc_value, traceback)
+            self.server = None
+
+    def send(self, sender_email: str, receiver_email: str, message: str) -> None:
+        """
+        Send a simple text email (SMTP), resetting the session if a previous
+        email was sent on it
+        """
+        if self.server is None:
+            raise RuntimeError("SMTPSession must be used as a context manager")
+        if self.has_sent:
+            self.server.rset()
+        self.server.sendmail(sender_email, receiver_email, message)
+        self.has_sent = True
+
+
+def send_email(
+    smtp_server: str,
+    smpt_port: int,
+    username: str,
+    password: str,
+    sender_email: str,
+    receiver_email: str,
+    message: str,
+) -> None:
+    """
+    Send a simple text email (SMTP) on a new connection
+    """
+    with SMTPSession(smtp_server, smpt_port, username, password) as session:
+        session.send(sender_email, receiver_email, message)
+
+
+def compiled_templates_are_fresh() -> bool:
+    """
+    Check that the precompiled templates exist and are newer than their sources
+
+    :return: True if the precompiled templates can be used
+    """
+    if not os.path.isdir(EMAIL_TEMPLATES_COMPILED_FOLDER):
+        return False
+    compiled_mtimes = [
+        entry.stat().st_mtime for entry in os.scandir(EMAIL_TEMPLATES_COMPILED_FOLDER)
+    ]
+    if not compiled_mtimes:
+        return False
+    oldest_compiled_mtime = min(compiled_mtimes)
+    return all(
+        entry.stat().st_mtime <= oldest_compiled_mtime
+        for entry in os.scandir(EMAIL_TEMPLATES_FOLDER)
+    )
+
+
+@lru_cache(maxsize=1)
+def get_template_environment() -> "jinja2.Environment":
+    """
+    Build the Jinja2 environment once, it caches the compiled templates.
+    Uses the templates precompiled by compile_email_templates.py when they are
+    up to date, otherwise falls back to parsing the email templates folder,
+    keeping their bytecode in a per user cache folder between runs
+
+    :return: A Jinja2 environment for the email templates
+    """
+    try:
+        import jinja2
+    except ModuleNotFoundError:
+        click.echo("Jinja2 is a required dependency for this script", err=True)
+        sys.exit(1)
+    if compiled_templates_are_fresh():
+        return jinja2.Environment(
+            loader=jinja2.ModuleLoader(EMAIL_TEMPLATES_COMPILED_FOLDER),
+            auto_reload=False,
+        )
+    return jinja2.Environment(
+        loader=jinja2.FileSystemLoader(EMAIL_TEMPLATES_FOLDER),
+        auto_reload=False,
+        bytecode_cache=jinja2.FileSystemBytecodeCache(
+            pattern="__superset_email_%s.cache"
+        ),
+    )
+
+
+def render_template(template_file: str, context: Mapping[str, Any]) -> str:
+    """
+    Simple render template based on a context of named parameters
+
+    :param template_file: The template file name, relative to the email templates folder
+    :param context: Named parameters to use when rendering the template
+    :return: Rendered template
+    """
+    template = get_template_environment().get_template(template_file)
+    return template.render(context)
+
+
+def inter_send_email(
+    username: str,
+    password: str,
+    sender_email: str,
+    receiver_email: str,
+    message: str,
+    dry_run: bool = False,
+) -> None:
+    """
+    Show the message and send it after the user confirms it
+
+    :param dry_run: Only write the message to stdout, without sending it
+    """
+    if dry_run:
+        click.echo(message)
+        return
+
+    import smtplib
+
+    separator = "--------------------------\n"
+    sys.stdout.write(f"{separator}SMTP Message\n{separator}{message}\n{separator}")
+    sys.stdout.flush()
+    confirm = input("Is the Email message ok? (yes/no): ")
+    if confirm.lower() not in {"y", "yes"}:
+        exit("Exit by user request")
+
+    try:
+        send_email(
+            SMTP_SERVER,
+            SMTP_PORT,
+            username,
+            password,
+            sender_email,
+            receiver_email,
+            message,
+        )
+        print("Email sent successfully")
+    except smtplib.SMTPAuthenticationError:
+        exit("SMTP User authentication error, Email not sent!")
+    except Exception as e:
+        exit(f"SMTP exception {e}")
+
+
+@dataclass
+class BaseParameters:
+    email: str
+    username: str
+    password: str
+    version: str
+    version_rc: str
+    template_arguments: Mapping[str, Any] = field(
+        default_factory=lambda: MappingProxyType({})
+    )
+    dry_run: bool = False
+
+    def __repr__(self) -> str:
+        return f"Apache Credentials: {self.email}/{self.username}/{self.version}/{self.version_rc}"
+
+
+def send_rendered(
+    base_parameters: BaseParameters,
+    template_file: str,
+    receiver_email: str,
+    **extra: Any,
+) -> None:
+    """
+    Render an email template and send it after the user confirms it
+
+    :param base_parameters: The CLI parameters holding the credentials and context
+    :param template_file: The template file name, relative to the email templates folder
+    :param receiver_email: The email address to send the message to
+    :extra: Additional named parameters to use when rendering the template
+    """
+    context = {
+        **base_parameters.template_arguments,
+        "receiver_email": receiver_email,
+        **extra,
+    }
+    message = render_template(template_file, context)
+    inter_send_email(
+        base_parameters.username,
+        base_parameters.password,
+        base_parameters.email,
+        receiver_email,
+        message,
+        dry_run=base_parameters.dry_run,
+    )
@@ -0,0 +1,70 @@
+#
+# Licensed to the Apache Software Foundation (ASF) under one or more
+# contributor license agreements.  See the NOTICE file distributed with
+# this work for additional information regarding copyright ownership.
+# The ASF licenses this file to You under the Apache License, Version 2.0
+# (the "License"); you may not use this file except in compliance with
+# the License.  You may obtain a copy of the License at
+#
+#    http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+#
+import click
+from _core import BaseParameters, send_rendered, string_comma_to_list
+
+
+@click.command("result_pmc")
+@click.option(
+    "--receiver_email",
+    default="dev@superset.apache.org",
+    type=str,
+    prompt="The receiver email (To:)",
+)
+@click.option(
+    "--vote_bindings",
+    default="",
+    type=str,
+    prompt="A List of people with +1 binding vote (ex: Max,Grace,Krist)",
+)
+@click.option(
+    "--vote_nonbindings",
+    default="",
+    type=str,
+    prompt="A List of people with +1 non binding vote (ex: Ville)",
+)
+@click.option(
+    "--vote_negatives",
+    default="",
+    type=str,
+    prompt="A List of people with -1 vote (ex: John)",
+)
+@click.option(
+    "--vote_thread",
+    default="",
+    type=str,
+    prompt="Permalink to the vote thread "
+    "(see https://lists.apache.org/list.html?dev@superset.apache.org)",
+)
+@click.pass_obj
+def result_pmc(
+    base_parameters: BaseParameters,
+    receiver_email: str,
+    vote_bindings: str,
+    vote_nonbindings: str,
+    vote_negatives: str,
+    vote_thread: str,
+) -> None:
+    send_rendered(
+        base_parameters,
+        "result_pmc.j2",
+        receiver_email,
+        vote_bindings=string_comma_to_list(vote_bindings),
+        vote_nonbindings=string_comma_to_list(vote_nonbindings),
+        vote_negatives=string_comma_to_list(vote_negatives),
+        vote_thread=vote_thread,
+    )
@@ -0,0 +1,41 @@
+#!/usr/bin/python3
+#
+# Licensed to the Apache Software Foundation (ASF) under one or more
+# contributor license agreements.  See the NOTICE file distributed with
+# this work for additional information regarding copyright ownership.
+# The ASF licenses this file to You under the Apache License, Version 2.0
+# (the "License"); you may not use this file except in compliance with
+# the License.  You may obtain a copy of the License at
+#
+#    http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+#
+"""
+Precompiles the email templates used by send_email.py into Python modules,
+so that sending an email skips parsing the Jinja2 templates.
+Run it again every time a template in email_templates is changed.
+"""
+import shutil
+
+try:
+    import jinja2
+except ModuleNotFoundError:
+    exit("Jinja2 is a required dependency for this script")
+
+from _core import EMAIL_TEMPLATES_COMPILED_FOLDER, EMAIL_TEMPLATES_FOLDER
+
+
+def compile_email_templates() -> None:
+    # compile_templates never removes modules of deleted or renamed templates
+    shutil.rmtree(EMAIL_TEMPLATES_COMPILED_FOLDER, ignore_errors=True)
+    env = jinja2.Environment(loader=jinja2.FileSystemLoader(EMAIL_TEMPLATES_FOLDER))
+    env.compile_templates(EMAIL_TEMPLATES_COMPILED_FOLDER, zip=None, log_function=print)
+
+
+if __name__ == "__main__":
+    compile_email_templates()
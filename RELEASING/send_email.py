@@ -15,116 +15,76 @@
 # See the License for the specific language governing permissions and
 # limitations under the License.
 #
-import smtplib
-import ssl
-from typing import Any, Dict, List, Optional
+import importlib
+import os
+import sys
+from types import MappingProxyType
+from typing import Any, Dict, List, Optional, Tuple, TYPE_CHECKING
 
-from click.core import Context
+if TYPE_CHECKING:
+    from click import Context
 
-try:
-    import jinja2
-except ModuleNotFoundError:
-    exit("Jinja2 is a required dependency for this script")
 try:
     import click
 except ModuleNotFoundError:
     exit("Click is a required dependency for this script")
 
+from _core import BaseParameters, PROJECT_DESCRIPTION, PROJECT_MODULE, PROJECT_NAME
 
-SMTP_PORT = 587
-SMTP_SERVER = "mail-relay.apache.org"
-PROJECT_NAME = "Superset"
-PROJECT_MODULE = "superset"
-PROJECT_DESCRIPTION = "Apache Superset is a modern, enterprise-ready business intelligence web application"
-
-
-def string_comma_to_list(message: str) -> List[str]:
-    if not message:
-        return []
-    return [element.strip() for element in message.split(",")]
+HELP_OPTION_NAMES = ["-h", "--help"]
 
 
-def send_email(
-    smtp_server: str,
-    smpt_port: int,
-    username: str,
-    password: str,
-    sender_email: str,
-    receiver_email: str,
-    message: str,
-) -> None:
-    """
-    Send a simple text email (SMTP)
+class LazyGroup(click.Group):
     """
-    context = ssl.create_default_context()
-    with smtplib.SMTP(smtp_server, smpt_port) as server:
-        server.starttls(context=context)
-        server.login(username, password)
-        server.sendmail(sender_email, receiver_email, message)
-
+    A click Group that only imports a subcommand's module when it's invoked
 
-def render_template(template_file: str, **kwargs: Any) -> str:
+    :param lazy_subcommands: Maps each command name to a
+        ``(module_path, attribute)`` tuple where the command is defined
     """
-    Simple render template based on named parameters
-
-    :param template_file: The template file location
-    :kwargs: Named parameters to use when rendering the template
-    :return: Rendered template
-    """
-    template = jinja2.Template(open(template_file).read())
-    return template.render(kwargs)
-
-
-def inter_send_email(
-    username: str, password: str, sender_email: str, receiver_email: str, message: str
-) -> None:
-    print("--------------------------")
-    print("SMTP Message")
-    print("--------------------------")
-    print(message)
-    print("--------------------------")
-    confirm = input("Is the Email message ok? (yes/no): ")
-    if confirm not in ("Yes", "yes", "y"):
-        exit("Exit by user request")
-
-    try:
-        send_email(
-            SMTP_SERVER,
-            SMTP_PORT,
-            username,
-            password,
-            sender_email,
-            receiver_email,
-            message,
-        )
-        print("Email sent successfully")
-    except smtplib.SMTPAuthenticationError:
-        exit("SMTP User authentication error, Email not sent!")
-    except Exception as e:
-        exit(f"SMTP exception {e}")
-
 
-class BaseParameters(object):
     def __init__(
         self,
-        email: str,
-        username: str,
-        password: str,
-        version: str,
-        version_rc: str,
+        *args: Any,
+        lazy_subcommands: Optional[Dict[str, Tuple[str, str]]] = None,
+        **kwargs: Any,
     ) -> None:
-        self.email = email
-        self.username = username
-        self.password = password
-        self.version = version
-        self.version_rc = version_rc
-        self.template_arguments: Dict[str, Any] = {}
+        super().__init__(*args, **kwargs)
+        self.lazy_subcommands = lazy_subcommands or {}
 
-    def __repr__(self) -> str:
-        return f"Apache Credentials: {self.email}/{self.username}/{self.version}/{self.version_rc}"
+    def list_commands(self, ctx: "Context") -> List[str]:
+        return sorted({*super().list_commands(ctx), *self.lazy_subcommands})
 
+    def get_command(self, ctx: "Context", cmd_name: str) -> Optional[click.Command]:
+        if cmd_name not in self.lazy_subcommands:
+            return super().get_command(ctx, cmd_name)
+        module_path, attribute = self.lazy_subcommands[cmd_name]
+        return getattr(importlib.import_module(module_path), attribute)
 
-@click.group()
+
+class SMTPCredentialOption(click.Option):
+    """
+    A click Option that is only prompted for when the email is actually sent,
+    it's left empty on a dry run
+    """
+
+    def prompt_for_value(self, ctx: "Context") -> Any:
+        if ctx.params.get("dry_run"):
+            return ""
+        return super().prompt_for_value(ctx)
+
+
+@click.group(
+    cls=LazyGroup,
+    context_settings={
+        "auto_envvar_prefix": "SUPERSET",
+        "help_option_names": HELP_OPTION_NAMES,
+    },
+    lazy_subcommands={
+        "announce": ("commands.announce", "announce"),
+        "result_pmc": ("commands.result_pmc", "result_pmc"),
+        "vote_pmc": ("commands.vote_pmc", "vote_pmc"),
+    },
+)
 @click.pass_context
 @click.option(
     "--apache_email",
@@ -132,140 +92,111 @@ class BaseParameters(object):
     help="Your Apache email this will be used for SMTP From",
 )
 @click.option(
-    "--apache_username", prompt="Apache username", help="Your LDAP Apache username"
+    "--apache_username",
+    cls=SMTPCredentialOption,
+    prompt="Apache username",
+    help="Your LDAP Apache username",
 )
 @click.option(
     "--apache_password",
+    cls=SMTPCredentialOption,
     prompt="Apache password",
     hide_input=True,
     help="Your LDAP Apache password",
 )
-@click.option("--version", envvar="SUPERSET_VERSION")
-@click.option("--version_rc", envvar="SUPERSET_VERSION_RC")
+@click.option("--version")
+@click.option("--version_rc")
+@click.option(
+    "--dry_run",
+    is_flag=True,
+    is_eager=True,
+    help="Write the rendered email to stdout instead of sending it",
+)
 def cli(
-    ctx: Context,
+    ctx: "Context",
     apache_email: str,
     apache_username: str,
     apache_password: str,
     version: str,
     version_rc: str,
+    dry_run: bool,
 ) -> None:
     """Welcome to releasing send email CLI interface!"""
     base_parameters = BaseParameters(
-        apache_email, apache_username, apache_password, version, version_rc
+        apache_email,
+        apache_username,
+        apache_password,
+        version,
+        version_rc,
+        template_arguments=MappingProxyType(
+            {
+                "project_name": PROJECT_NAME,
+                "project_module": PROJECT_MODULE,
+                "project_description": PROJECT_DESCRIPTION,
+                "version": version,
+                "version_rc": version_rc,
+                "sender_email": apache_email,
+            }
+        ),
+        dry_run=dry_run,
     )
-    base_parameters.template_arguments["project_name"] = PROJECT_NAME
-    base_parameters.template_arguments["project_module"] = PROJECT_MODULE
-    base_parameters.template_arguments["project_description"] = PROJECT_DESCRIPTION
-    base_parameters.template_arguments["version"] = base_parameters.version
-    base_parameters.template_arguments["version_rc"] = base_parameters.version_rc
-    base_parameters.template_arguments["sender_email"] = base_parameters.email
     ctx.obj = base_parameters
 
 
-@cli.command("vote_pmc")
-@click.option(
-    "--receiver_email",
-    default="dev@superset.apache.org",
-    type=str,
-    prompt="The receiver email (To:)",
-)
-@click.pass_obj
-def vote_pmc(base_parameters: BaseParameters, receiver_email: str) -> None:
-    template_file = "email_templates/vote_pmc.j2"
-    base_parameters.template_arguments["receiver_email"] = receiver_email
-    message = render_template(template_file, **base_parameters.template_arguments)
-    inter_send_email(
-        base_parameters.username,
-        base_parameters.password,
-        base_parameters.template_arguments["sender_email"],
-        base_parameters.template_arguments["receiver_email"],
-        message,
-    )
-
+def print_command_help(cmd_name: str) -> None:
+    """
+    Print a subcommand's help without parsing the group options,
+    so their prompts don't fire and no BaseParameters is built
 
-@cli.command("result_pmc")
-@click.option(
-    "--receiver_email",
-    default="dev@superset.apache.org",
-    type=str,
-    prompt="The receiver email (To:)",
-)
-@click.option(
-    "--vote_bindings",
-    default="",
-    type=str,
-    prompt="A List of people with +1 binding vote (ex: Max,Grace,Krist)",
-)
-@click.option(
-    "--vote_nonbindings",
-    default="",
-    type=str,
-    prompt="A List of people with +1 non binding vote (ex: Ville)",
-)
-@click.option(
-    "--vote_negatives",
-    default="",
-    type=str,
-    prompt="A List of people with -1 vote (ex: John)",
-)
-@click.option(
-    "--vote_thread",
-    default="",
-    type=str,
-    prompt="Permalink to the vote thread "
-    "(see https://lists.apache.org/list.html?dev@superset.apache.org)",
-)
-@click.pass_obj
-def result_pmc(
-    base_parameters: BaseParameters,
-    receiver_email: str,
-    vote_bindings: str,
-    vote_nonbindings: str,
-    vote_negatives: str,
-    vote_thread: str,
-) -> None:
-    template_file = "email_templates/result_pmc.j2"
-    base_parameters.template_arguments["receiver_email"] = receiver_email
-    base_parameters.template_arguments["vote_bindings"] = string_comma_to_list(
-        vote_bindings
-    )
-    base_parameters.template_arguments["vote_nonbindings"] = string_comma_to_list(
-        vote_nonbindings
-    )
-    base_parameters.template_arguments["vote_negatives"] = string_comma_to_list(
-        vote_negatives
-    )
-    base_parameters.template_arguments["vote_thread"] = vote_thread
-    message = render_template(template_file, **base_parameters.template_arguments)
-    inter_send_email(
-        base_parameters.username,
-        base_parameters.password,
-        base_parameters.template_arguments["sender_email"],
-        base_parameters.template_arguments["receiver_email"],
-        message,
-    )
+    :param cmd_name: The subcommand name
+    """
+    prog_name = os.path.basename(sys.argv[0])
+    with click.Context(cli, info_name=prog_name, **cli.context_settings) as ctx:
+        command = cli.get_command(ctx, cmd_name)
+        if command is None:
+            return
+        with click.Context(
+            command, info_name=cmd_name, parent=ctx, **command.context_settings
+        ) as command_ctx:
+            click.echo(command.get_help(command_ctx))
+
+
+def sniff_help_subcommand(args: List[str]) -> Optional[str]:
+    """
+    Find the subcommand whose help was requested, parsing the group options
+    without prompting for them
 
+    :param args: The command line arguments
+    :return: The subcommand name, or None if no subcommand help was requested
+    """
+    prog_name = os.path.basename(sys.argv[0])
+    try:
+        ctx = cli.make_context(prog_name, list(args), resilient_parsing=True)
+    except click.ClickException:
+        return None
+    if not ctx.protected_args:
+        return None
+    cmd_name = ctx.protected_args[0]
+    if cmd_name not in cli.list_commands(ctx):
+        return None
+    if not any(arg in HELP_OPTION_NAMES for arg in ctx.args):
+        return None
+    return cmd_name
+
+
+def main(args: Optional[List[str]] = None) -> None:
+    """
+    Entry point, sniffs for a subcommand's --help before running the full CLI
 
-@cli.command("announce")
-@click.option(
-    "--receiver_email",
-    default="dev@superset.apache.org",
-    type=str,
-    prompt="The receiver email (To:)",
-)
-@click.pass_obj
-def announce(base_parameters: BaseParameters, receiver_email: str) -> None:
-    template_file = "email_templates/announce.j2"
-    base_parameters.template_arguments["receiver_email"] = receiver_email
-    message = render_template(template_file, **base_parameters.template_arguments)
-    inter_send_email(
-        base_parameters.username,
-        base_parameters.password,
-        base_parameters.template_arguments["sender_email"],
-        base_parameters.template_arguments["receiver_email"],
-        message,
-    )
+    :param args: The command line arguments, defaults to sys.argv
+    """
+    args = sys.argv[1:] if args is None else args
+    cmd_name = sniff_help_subcommand(args)
+    if cmd_name:
+        print_command_help(cmd_name)
+        return
+    cli(args)
 
 
-cli()
+if __name__ == "__main__":
+    main()
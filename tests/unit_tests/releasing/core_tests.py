@@ -0,0 +1,40 @@
+# -*- coding: utf-8 -*-
+# Licensed to the Apache Software Foundation (ASF) under one
+# or more contributor license agreements.  See the NOTICE file
+# distributed with this work for additional information
+# regarding copyright ownership.  The ASF licenses this file
+# to you under the Apache License, Version 2.0 (the
+# "License"); you may not use this file except in compliance
+# with the License.  You may obtain a copy of the License at
+#
+#   http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing,
+# software distributed under the License is distributed on an
+# "AS IS" BASIS, WITHOUT WARRANTIES OR CONDITIONS OF ANY
+# KIND, either express or implied.  See the License for the
+# specific language governing permissions and limitations
+import os
+import sys
+from typing import List
+
+import pytest
+
+sys.path.insert(
+    0, os.path.join(os.path.dirname(__file__), "..", "..", "..", "RELEASING")
+)
+
+from _core import string_comma_to_list  # noqa: E402
+
+
+@pytest.mark.parametrize(
+    "message, expected",
+    [
+        ("Max,Grace,Krist", ["Max", "Grace", "Krist"]),
+        ("Max,,Grace", ["Max", "Grace"]),
+        (" Max, ,Grace,", ["Max", "Grace"]),
+        ("", []),
+    ],
+)
+def test_string_comma_to_list(message: str, expected: List[str]) -> None:
+    assert string_comma_to_list(message) == expected